@@ -424,16 +424,11 @@ class _Lib(_utils.Lib):
         return res
 
     def __get(self, name: str, *args: Type, **kwargs) -> Callable[..., int]:
-        l_lib = self.lib if not kwargs.get('variadic', False) else self.lib_variadic
         if kwargs.get('private', False):
             func_name = f'_CAEN_DGTZ_{name}'
         else:
             func_name = f'CAEN_DGTZ_{name}'
-        func = getattr(l_lib, func_name)
-        func.argtypes = args
-        func.restype = ct.c_int
-        func.errcheck = self.__api_errcheck
-        return func
+        return self.get_function(func_name, ct.c_int, args, variadic=kwargs.get('variadic', False), errcheck=self.__api_errcheck)
 
     # C API bindings
 
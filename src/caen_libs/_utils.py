@@ -7,12 +7,20 @@ __copyright__ = 'Copyright (C) 2024 CAEN SpA'
 __license__ = 'LGPL-3.0-or-later'
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from array import array
 import ctypes as ct
+import ctypes.util
 from dataclasses import dataclass, field
 import sys
-from functools import _lru_cache_wrapper, lru_cache, wraps
-from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union, overload
-from weakref import ReferenceType, ref
+from functools import lru_cache, wraps
+
+if sys.version_info >= (3, 9):
+    from functools import cache as _cache
+else:
+    # functools.cache comes with Python 3.9, and is equivalent to this.
+    _cache = lru_cache(maxsize=None)
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union, overload
+from weakref import WeakKeyDictionary, ref
 
 if sys.platform == 'win32':
     _LibNotFoundClass = FileNotFoundError
@@ -20,6 +28,28 @@ else:
     _LibNotFoundClass = OSError
 
 
+# memchr from the C runtime, used to scan for null terminators with
+# a single foreign call rather than one ct.string_at per string.
+if sys.platform == 'win32':
+    _LIBC = ct.cdll.msvcrt
+else:
+    _LIBC = ct.CDLL(None)
+_memchr = _LIBC.memchr
+_memchr.argtypes = [ct.c_void_p, ct.c_int, ct.c_size_t]
+_memchr.restype = ct.c_void_p
+
+_MEMCHR_NO_BOUND = ct.c_size_t(-1).value  # Same unbounded scan done by strlen
+
+
+# To be unpacked in @dataclass decorations: slots removes the per-instance
+# __dict__, making attribute access a direct C-level slot read.
+# Not supported on Python <= 3.9.
+if sys.version_info >= (3, 10):
+    DATACLASS_SLOTS: Dict[str, bool] = {'slots': True}
+else:
+    DATACLASS_SLOTS = {}
+
+
 class Lib:
     """
     This class loads the shared library and
@@ -27,34 +57,43 @@ class Lib:
     using ctypes.
     """
 
+    # Resolved library paths, shared by all instances so that repeated
+    # constructions of the same Lib skip the search path scan.
+    _path_cache: ClassVar[Dict[str, str]] = {}
+
     def __init__(self, name: str) -> None:
         self.__name = name
+        self.__func_cache: Dict[str, Any] = {}
         self.__load_lib()
 
-    def __load_lib(self) -> None:
-        loader: ct.LibraryLoader
-        loader_variadic: ct.LibraryLoader
-
-        # Platform dependent stuff
+    def __resolve_path(self) -> str:
         if sys.platform == 'win32':
-            # API functions are declared as __stdcall, but variadic
-            # functions are __cdecl even if declared as __stdcall.
-            # This difference applies only to 32 bit applications,
-            # 64 bit applications have its own calling convention.
-            loader = ct.windll
-            loader_variadic = ct.cdll
-            path = f'{self.name}.dll'
-        else:
-            loader = ct.cdll
-            loader_variadic = ct.cdll
-            path = f'lib{self.name}.so'
+            path = self._path_cache.get(self.name)
+            if path is None:
+                # Resolve the full path once per process: loading by bare
+                # name walks the default DLL search path on every load.
+                path = ct.util.find_library(self.name)
+                if path is None:
+                    path = f'{self.name}.dll'
+                self._path_cache[self.name] = path
+            return path
+        return f'lib{self.name}.so'
 
-        self.__path = path
-
-        # Load library
+    def __load_lib(self) -> None:
+        self.__path = self.__resolve_path()
+
+        # Load library. On Windows API functions are declared as
+        # __stdcall, but variadic functions are __cdecl even if declared
+        # as __stdcall. This difference applies only to 32 bit
+        # applications, 64 bit applications have its own calling
+        # convention. On other platforms the two handles are the same, to
+        # avoid a second dlopen and a duplicate symbol table.
         try:
-            self.__lib = loader.LoadLibrary(path)
-            self.__lib_variadic = loader_variadic.LoadLibrary(self.path)
+            if sys.platform == 'win32':
+                self.__lib = ct.WinDLL(self.path, winmode=0)
+                self.__lib_variadic = ct.CDLL(self.path, winmode=0)
+            else:
+                self.__lib = ct.CDLL(self.path)
         except _LibNotFoundClass as ex:
             raise RuntimeError(
                 f'Library {self.name} not found. '
@@ -80,10 +119,37 @@ class Lib:
         """ctypes object to shared library"""
         return self.__lib
 
-    @property
-    def lib_variadic(self) -> Any:
-        """ctypes object to shared library (for variadic functions)"""
-        return self.__lib_variadic
+    if sys.platform == 'win32':
+        @property
+        def lib_variadic(self) -> Any:
+            """ctypes object to shared library (for variadic functions)"""
+            return self.__lib_variadic
+    else:
+        # cdecl is the only calling convention outside Windows: the
+        # variadic handle does not exist at all there.
+        @property
+        def lib_variadic(self) -> Any:
+            """ctypes object to shared library (for variadic functions)"""
+            return self.__lib
+
+    def get_function(self, name: str, restype: Type, argtypes: Sequence[Type], *, variadic: bool = False, errcheck: Optional[Callable] = None) -> Any:
+        """
+        Resolve a function of the shared library.
+
+        The resolved function, with prototype applied, is stored in an
+        internal cache: repeated calls skip both the symbol lookup done
+        by the ctypes __getattr__ and the prototype setup, keeping
+        high-frequency calls at pure C-call cost.
+        """
+        func = self.__func_cache.get(name)
+        if func is None:
+            func = getattr(self.lib_variadic if variadic else self.lib, name)
+            func.restype = restype
+            func.argtypes = argtypes
+            if errcheck is not None:
+                func.errcheck = errcheck
+            self.__func_cache[name] = func
+        return func
 
     # Python utilities
 
@@ -94,64 +160,114 @@ class Lib:
         return self.path
 
 
+# Typecodes of the unsigned array.array integer types, keyed by item size,
+# to match the size of any unsigned ctypes integer type on any platform.
+_ARRAY_TYPECODES: Dict[int, str] = {array(tc).itemsize: tc for tc in ('B', 'H', 'I', 'L', 'Q')}
+
+
+def to_ctypes_array(values: Sequence[int], c_type: Type) -> ct.Array:
+    """
+    Build a ctypes array of unsigned integers from a Python sequence.
+
+    The values are first collected into an array.array of matching item
+    size, whose constructor fills from the sequence with a single
+    C-level loop, and then wrapped in place with from_buffer: much
+    faster than the per-item conversion done by the ctypes array
+    constructor when unpacking a sequence. The returned array keeps the
+    intermediate buffer alive.
+    """
+    buffer = array(_ARRAY_TYPECODES[ct.sizeof(c_type)], values)
+    return (c_type * len(buffer)).from_buffer(buffer)
+
+
+@lru_cache(maxsize=None)
 def version_to_tuple(version: str) -> Tuple[int, ...]:
     """Version string in the form N.N.N to tuple (N, N, N)"""
     return tuple(map(int, version.split('.')))
 
 
-class CacheManager(List[_lru_cache_wrapper]):
+class CacheManager(List[Callable[[], None]]):
     """
-    A simple list of functions returned by `@lru_cache` decorator.
+    A simple list of cache invalidation functions.
 
     To be used with the optional parameter @p cache_manager of
-    lru_cache_method(), that will store a reference to the cached function
-    inside this list. This is a typing-safe way to call `cache_clear` and
-    `cache_info` of the internal cached functions, even if not exposed
-    directly by the inner function returned by lru_cache_method().
+    lru_cache_method(), that will store inside this list a function
+    clearing the caches of all the instances. This is a typing-safe way
+    to call `cache_clear` of the internal cached functions, even if not
+    exposed directly by the inner function returned by
+    lru_cache_method().
     """
     def clear_all(self) -> None:
-        """Invoke `cache_clear` on all functions in the list"""
-        for wrapper in self:
-            wrapper.cache_clear()
+        """Invoke all the invalidation functions in the list"""
+        for cache_clear in self:
+            cache_clear()
 
 
 # Typing support for decorators comes with Python 3.10.
 # Omitted because very verbose.
 
 
-def lru_cache_method(cache_manager: Optional[CacheManager] = None, maxsize: int = 128, typed: bool = False):
+def lru_cache_method(cache_manager: Optional[CacheManager] = None, maxsize: Optional[int] = 128, typed: bool = False):
     """
-    LRU cache decorator that keeps a weak reference to self.
+    LRU cache decorator that does not hold a reference to self.
 
     To be used as decorator on methods that are known to return always
     the same value. This can improve the performances of some methods
     by a factor > 1000.
-    This wrapper using weak references is required: functools.lru_cache
-    holds a reference to all arguments: using directly on the methods it
-    would hold a reference to self, introducing subdle memory leaks.
+    Each instance gets its own cache, stored in a WeakKeyDictionary so
+    that it vanishes with the instance itself: functools.lru_cache holds
+    a reference to all arguments: using directly on the methods it would
+    hold a reference to self, introducing subdle memory leaks. Keeping
+    self out of the cache key also makes the key tuple (and its hash)
+    contain only the method arguments.
 
     @sa https://stackoverflow.com/a/68052994/3287591
     """
 
     def wrapper(method):
 
-        @lru_cache(maxsize, typed)
-        # ReferenceType is not subscriptable on Python <= 3.8
-        def cached_method(self_ref: ReferenceType, *args, **kwargs):
-            self = self_ref()
-            assert self is not None  # this function is always called by inner()
-            return method(self, *args, **kwargs)
+        # WeakKeyDictionary is not subscriptable on Python <= 3.8
+        instance_caches: WeakKeyDictionary = WeakKeyDictionary()
+
+        # With no size bound there is no eviction: dispatch to the
+        # lightweight functools.cache that skips the LRU bookkeeping
+        # done on every hit by the bounded variant.
+        if maxsize is None and not typed:
+            cache_decorator = _cache
+        else:
+            cache_decorator = lru_cache(maxsize, typed)
+
+        # Bound once here: saves an attribute lookup per call in inner().
+        instance_caches_get = instance_caches.get
 
         @wraps(method)
         def inner(self, *args, **kwargs):
+            cached_method = instance_caches_get(self)
+            if cached_method is None:
+                # The cache closes over a weak reference: caching the
+                # bound method would keep self alive through the
+                # dictionary value, that references the key.
+                self_ref = ref(self)
+
+                @cache_decorator
+                def cached_method(*args, **kwargs):
+                    self = self_ref()
+                    assert self is not None  # cache only reachable through a live self
+                    return method(self, *args, **kwargs)
+
+                instance_caches[self] = cached_method
             # Ignore MyPy type checks because of bugs on lru_cache support.
             # See https://stackoverflow.com/a/73517689/3287591.
-            return cached_method(ref(self), *args, **kwargs)  # type: ignore
+            return cached_method(*args, **kwargs)  # type: ignore
+
+        def clear_all_instances() -> None:
+            for cached_method in list(instance_caches.values()):
+                cached_method.cache_clear()
 
-        # Optionally store a reference to lru_cache decorated function to
-        # simplify cache management. See CacheManager documentation.
+        # Optionally store an invalidation function to simplify cache
+        # management. See CacheManager documentation.
         if cache_manager is not None:
-            cache_manager.append(cached_method)
+            cache_manager.append(clear_all_instances)
 
         return inner
 
@@ -168,25 +284,19 @@ def lru_cache_clear(cache_manager: CacheManager):
 
     def wrapper(method):
 
-        # ReferenceType is not subscriptable on Python <= 3.8
-        def not_cached_method(self_ref: ReferenceType, *args, **kwargs):
-            self = self_ref()
-            assert self is not None  # this function is always called by inner()
-            return method(self, *args, **kwargs)
-
         @wraps(method)
         def inner(self, *args, **kwargs):
-            # Ignore MyPy type checks because of bugs on lru_cache support.
-            # See https://stackoverflow.com/a/73517689/3287591.
+            # No caching here, so no weak reference gymnastics needed:
+            # just clear the caches and forward the call.
             cache_manager.clear_all()
-            return not_cached_method(ref(self), *args, **kwargs)  # type: ignore
+            return method(self, *args, **kwargs)
 
         return inner
 
     return wrapper
 
 
-def str_from_char(data: Union[ct.c_char, ct.Array], n_strings: int) -> Iterator[str]:
+def str_from_char(data: Union[ct.c_char, ct.Array], n_strings: int) -> List[str]:
     """
     Split a buffer into a list of N string.
     Strings are separated by the null terminator.
@@ -194,20 +304,32 @@ def str_from_char(data: Union[ct.c_char, ct.Array], n_strings: int) -> Iterator[
 
     Note: ct.Array is not subscriptable on Python 3.8, could be ct.Array[ct.c_char]
     """
+    if n_strings == 0:
+        return []
+    # Locate the terminator of the last string with one cheap memchr
+    # call per string, then copy the whole packed buffer with a single
+    # ct.string_at and split it at Python level: N small FFI copies
+    # collapse into one.
     data_addr = ct.addressof(data)
+    end_addr = data_addr
     for _ in range(n_strings):
-        value = ct.string_at(data_addr)
-        data_addr += len(value) + 1
-        yield value.decode()
+        terminator = _memchr(end_addr, 0, _MEMCHR_NO_BOUND)
+        assert terminator is not None
+        end_addr = terminator + 1
+    raw = ct.string_at(data_addr, end_addr - 1 - data_addr)
+    return [value.decode() for value in raw.split(b'\x00')]
 
 
-def str_from_char_p(data: ct._Pointer, n_strings: int) -> Iterator[str]:
+def str_from_char_p(data: ct._Pointer, n_strings: int) -> Iterable[str]:
     """
     Same of _str_from_char.
     For pointers to ct.c_char, to avoid dereferences in case of zero size.
     """
-    if n_strings != 0:
-        yield from str_from_char(data.contents, n_strings)
+    # Skip the dereference on the empty path and return the interned
+    # empty tuple, with no allocation at all.
+    if n_strings == 0:
+        return ()
+    return str_from_char(data.contents, n_strings)
 
 
 def str_from_char_array(data: Union[ct.c_char, ct.Array], string_size: int) -> Iterator[str]:
@@ -218,40 +340,69 @@ def str_from_char_array(data: Union[ct.c_char, ct.Array], string_size: int) -> I
     """
     data_addr = ct.addressof(data)
     while True:
-        value = ct.string_at(data_addr)
-        if len(value) == 0:
+        # Bound the scan to the string size: a buffer missing the
+        # empty-string sentinel would otherwise be scanned to the end
+        # of the memory.
+        terminator = _memchr(data_addr, 0, string_size)
+        if terminator == data_addr:
             return
+        size = string_size if terminator is None else terminator - data_addr
+        yield ct.string_at(data_addr, size).decode()
         data_addr += string_size
-        yield value.decode()
 
 
-def str_from_n_char_array(data: Union[ct.c_char, ct.Array], string_size: int, n_strings: int) -> Iterator[str]:
+def str_from_n_char_array(data: Union[ct.c_char, ct.Array], string_size: int, n_strings: int) -> List[str]:
     """
     Split a buffer of fixed size string.
     Size is passed as parameter.
     For ct.c_char and arrays of it.
     """
-    data_addr = ct.addressof(data)
-    for _ in range(n_strings):
-        value = ct.string_at(data_addr)
-        data_addr += string_size
-        yield value.decode()
+    # Copy the whole buffer with a single ct.string_at call and slice
+    # the fixed size slots in pure Python: split does the null
+    # terminator scan at C level, with no foreign call per string, and
+    # degrades to the whole slot if the terminator is missing.
+    buffer_size = string_size * n_strings
+    raw = ct.string_at(ct.addressof(data), buffer_size)
+    slots = (raw[offset:offset + string_size] for offset in range(0, buffer_size, string_size))
+    return [value.split(b'\x00', 1)[0].decode() for value in slots]
 
 
-def str_from_n_char_array_p(data: ct._Pointer, string_size: int, n_strings: int) -> Iterator[str]:
+def str_from_n_char_array_p(data: ct._Pointer, string_size: int, n_strings: int) -> Iterable[str]:
     """
     Same of _str_from_n_char_array.
     For pointers to ct.c_char, to avoid dereferences in case of zero size.
     """
-    if n_strings != 0:
-        yield from str_from_n_char_array(data.contents, string_size, n_strings)
+    # See comment in str_from_char_p.
+    if n_strings == 0:
+        return ()
+    return str_from_n_char_array(data.contents, string_size, n_strings)
+
+
+@lru_cache(maxsize=64)
+def _slice_to_range(start: Optional[int], stop: Optional[int], step: Optional[int]) -> range:
+    """
+    Convert slice indices to the equivalent range.
+
+    Memoized because polling loops tend to access the same register
+    slice over and over: repeated shapes skip both the validation and
+    the range allocation. Safe to share since range is immutable.
+    """
+    if start is None or stop is None:
+        raise ValueError('Both start and stop must be specified.')
+    return range(start, stop, 1 if step is None else step)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Registers:
     """
     Class to simplify syntax for registers access with
     square brackets operators, slices and in-place operators.
+
+    Whenever the underlying library provides a bulk access function,
+    it should be wired to @p multi_getter and @p multi_setter: slice
+    accesses then translate to a single library call for any number of
+    registers, instead of one call per register as done by the fallback
+    loops over @p getter and @p setter.
     """
 
     getter: Callable[[int], int]
@@ -271,21 +422,16 @@ class Registers:
         """Get multiple value"""
         if self.multi_getter is not None:
             return self.multi_getter(addresses)
-        return [self.get(i) for i in addresses]
+        # map iterates without per-step bytecode dispatch, and accepts any
+        # iterable (including range) without materializing a list.
+        return list(map(self.getter, addresses))
 
     def multi_set(self, addresses: Sequence[int], values: Sequence[int]) -> None:
         """Set multiple value"""
         if self.multi_setter is not None:
             return self.multi_setter(addresses, values)
-        for a, v in zip(addresses, values):
-            self.set(a, v)
-
-    @staticmethod
-    def __get_addresses(key: slice) -> Sequence[int]:
-        if key.start is None or key.stop is None:
-            raise ValueError('Both start and stop must be specified.')
-        step = 1 if key.step is None else key.step
-        return range(key.start, key.stop, step)
+        for _ in map(self.setter, addresses, values):
+            pass
 
     @overload
     def __getitem__(self, address: int) -> int: ...
@@ -293,11 +439,18 @@ class Registers:
     def __getitem__(self, address: slice) -> List[int]: ...
 
     def __getitem__(self, address):
+        # Exact type check first: single register access is the common
+        # path, and type() is faster than isinstance() there.
+        if type(address) is int:
+            return self.getter(address)
         if isinstance(address, int):
             return self.get(address)
         if isinstance(address, slice):
-            addresses = self.__get_addresses(address)
-            return self.multi_get(addresses)
+            addresses = _slice_to_range(address.start, address.stop, address.step)
+            multi_getter = self.multi_getter
+            if multi_getter is not None:
+                return multi_getter(addresses)
+            return list(map(self.getter, addresses))
         raise TypeError('Invalid argument type.')
 
     @overload
@@ -306,11 +459,19 @@ class Registers:
     def __setitem__(self, address: slice, value: Sequence[int]) -> None: ...
 
     def __setitem__(self, address, value):
+        # See comment in __getitem__.
+        if type(address) is int:
+            return self.setter(address, value)
         if isinstance(address, int):
             return self.set(address, value)
         if isinstance(address, slice) and isinstance(value, Sequence):
-            addresses = self.__get_addresses(address)
+            addresses = _slice_to_range(address.start, address.stop, address.step)
             if len(value) != len(addresses):
                 raise ValueError('Invalid value size.')
-            return self.multi_set(addresses, value)
+            multi_setter = self.multi_setter
+            if multi_setter is not None:
+                return multi_setter(addresses, value)
+            for _ in map(self.setter, addresses, value):
+                pass
+            return None
         raise TypeError('Invalid argument type.')
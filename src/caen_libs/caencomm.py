@@ -157,11 +157,7 @@ class _Lib(_utils.Lib):
                 def fallback(*args, **kwargs):
                     raise RuntimeError(f'{name} requires {self.name} >= {min_version}. Please update it.')
                 return fallback
-        func = getattr(self.lib, f'CAENComm_{name}')
-        func.argtypes = args
-        func.restype = ct.c_int
-        func.errcheck = self.__api_errcheck
-        return func
+        return self.get_function(f'CAENComm_{name}', ct.c_int, args, errcheck=self.__api_errcheck)
 
     def __ver_at_least(self, target: Tuple[int, ...]) -> bool:
         ver = self.sw_release()
@@ -327,8 +323,8 @@ class Device:
         Binding of CAENComm_MultiWrite32()
         """
         n_cycles = len(address)
-        l_address = (ct.c_uint32 * n_cycles)(*address)
-        l_data = (ct.c_uint32 * n_cycles)(*data)
+        l_address = _utils.to_ctypes_array(address, ct.c_uint32)
+        l_data = _utils.to_ctypes_array(data, ct.c_uint32)
         l_error_code = (ct.c_int * n_cycles)()
         lib.multi_write32(self.handle, l_address, n_cycles, l_data, l_error_code)
         if any(l_error_code):
@@ -340,8 +336,8 @@ class Device:
         Binding of CAENComm_MultiWrite16()
         """
         n_cycles = len(address)
-        l_address = (ct.c_uint32 * n_cycles)(*address)
-        l_data = (ct.c_uint16 * n_cycles)(*data)
+        l_address = _utils.to_ctypes_array(address, ct.c_uint32)
+        l_data = _utils.to_ctypes_array(data, ct.c_uint16)
         l_error_code = (ct.c_int * n_cycles)()
         lib.multi_write16(self.handle, l_address, n_cycles, l_data, l_error_code)
         if any(l_error_code):
@@ -353,7 +349,7 @@ class Device:
         Binding of CAENComm_MultiRead32()
         """
         n_cycles = len(address)
-        l_address = (ct.c_uint32 * n_cycles)(*address)
+        l_address = _utils.to_ctypes_array(address, ct.c_uint32)
         l_data = (ct.c_uint32 * n_cycles)()
         l_error_code = (ct.c_int * n_cycles)()
         lib.multi_read32(self.handle, l_address, n_cycles, l_data, l_error_code)
@@ -367,7 +363,7 @@ class Device:
         Binding of CAENComm_MultiRead16()
         """
         n_cycles = len(address)
-        l_address = (ct.c_uint32 * n_cycles)(*address)
+        l_address = _utils.to_ctypes_array(address, ct.c_uint32)
         l_data = (ct.c_uint16 * n_cycles)()
         l_error_code = (ct.c_int * n_cycles)()
         lib.multi_read16(self.handle, l_address, n_cycles, l_data, l_error_code)
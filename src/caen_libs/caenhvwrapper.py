@@ -7,20 +7,62 @@ __copyright__ = 'Copyright (C) 2024 CAEN SpA'
 __license__ = 'LGPL-3.0-or-later'
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from array import array
+import asyncio
 import ctypes as ct
 import ctypes.wintypes as ctw
 import os
+import select
 import socket
+import struct
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import IntEnum, unique
-from typing import (Any, Callable, ClassVar, Dict, Iterator, List, Optional,
+from functools import lru_cache
+from typing import (Any, Callable, ClassVar, Iterator, List, Optional,
                     Sequence, Tuple, Type, TypeVar, Union)
 
 from caen_libs import error, _utils
 
 
+@lru_cache(maxsize=512)
+def _enc(name: str) -> bytes:
+    """
+    Memoized str.encode.
+
+    Polling loops pass the same few parameter and property names over
+    and over: caching the encoded form skips a bytes allocation per
+    call.
+    """
+    return name.encode()
+
+
+@lru_cache(maxsize=128)
+def _encode_params(params: Tuple[str, ...]) -> bytes:
+    """
+    Memoized colon-joined parameter list, in the form expected by the
+    subscribe functions: monitoring code tends to (un)subscribe the
+    same set over and over.
+    """
+    # Joining encoded names skips the intermediate joined str; names are
+    # plain ASCII so the result is identical to encoding the joined str.
+    return b':'.join(map(_enc, params))
+
+
+@lru_cache(maxsize=1024)
+def _dec(raw: bytes) -> str:
+    """
+    Memoized bytes.decode.
+
+    Event streams carry the same few item ids thousands of times:
+    caching the decoded form skips a str allocation per event.
+    """
+    return raw.decode()
+
+
 @unique
 class SystemType(IntEnum):
     """
@@ -98,6 +140,15 @@ class EventType(IntEnum):
     TRMODE      = 3
 
 
+# Plain dicts resolve members with a single hash lookup, while calling
+# the enum class goes through EnumMeta.__call__ for every value: the
+# event paths decode one EventType per event and 17 EventStatus per
+# read, so they use these maps and fall back to the enum call (and its
+# ValueError) only for values not in the map.
+_EVENT_STATUS_MEMBERS = {member.value: member for member in EventStatus}
+_EVENT_TYPE_MEMBERS = {member.value: member for member in EventType}
+
+
 class _IdValueRaw(ct.Union):
     _fields_ = [
         ('StringValue', ct.c_char * 1024),
@@ -117,7 +168,7 @@ class _EventDataRaw(ct.Structure):
     ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_utils.DATACLASS_SLOTS)
 class EventData:
     """
     Binding of ::CAENHVEVENT_TYPE_t
@@ -340,80 +391,190 @@ else:
     _socket = ct.c_int
 
 
-_SYS_PROP_TYPE_GET_ARG: Dict[SysPropType, Callable] = {
-    SysPropType.STR:        lambda v: v.value.decode(),
-    SysPropType.REAL:       lambda v: ct.cast(v, _P(ct.c_float)).contents.value,
-    SysPropType.UINT2:      lambda v: ct.cast(v, _P(ct.c_uint16)).contents.value,
-    SysPropType.UINT4:      lambda v: ct.cast(v, _P(ct.c_uint32)).contents.value,
-    SysPropType.INT2:       lambda v: ct.cast(v, _P(ct.c_int16)).contents.value,
-    SysPropType.INT4:       lambda v: ct.cast(v, _P(ct.c_int32)).contents.value,
-    SysPropType.BOOLEAN:    lambda v: bool(ct.cast(v, _P(ct.c_uint)).contents.value),
-}
+def _sys_prop_get_scalar(fmt: str, conv: Optional[Callable] = None) -> Callable:
+    # struct reads straight from the buffer protocol, skipping the
+    # pointer object and the ctypes scalar that ct.cast would allocate
+    # on every get. '=' means native order with standard sizes, the
+    # same layout ctypes uses for these types.
+    unpack_from = struct.Struct(fmt).unpack_from
+    if conv is None:
+        def get_arg(value):
+            return unpack_from(value)[0]
+    else:
+        def get_arg(value):
+            return conv(unpack_from(value)[0])
+    return get_arg
+
+
+# Dispatch tables are tuples indexed by the enum value: the enums are
+# contiguous from zero, and tuple indexing skips the hashing of a dict
+# lookup on these per-call paths.
+_SYS_PROP_TYPE_GET_ARG: Tuple[Callable, ...] = (
+    lambda v: v.value.decode(),         # SysPropType.STR
+    _sys_prop_get_scalar('=f'),         # SysPropType.REAL
+    _sys_prop_get_scalar('=H'),         # SysPropType.UINT2
+    _sys_prop_get_scalar('=I'),         # SysPropType.UINT4
+    _sys_prop_get_scalar('=h'),         # SysPropType.INT2
+    _sys_prop_get_scalar('=i'),         # SysPropType.INT4
+    _sys_prop_get_scalar('=I', bool),   # SysPropType.BOOLEAN
+)
+
+
+class _SysPropSetScratch(threading.local):
+    """
+    Reusable ctypes scalars for set_sys_prop, one set per thread.
+
+    Writing into a preallocated scalar and passing it with ct.byref
+    avoids a fresh ctypes scalar plus pointer allocation on every set
+    call. Safe to reuse because the library copies the value before
+    CAENHV_SetSysProp returns.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.real = ct.c_float()
+        self.uint2 = ct.c_uint16()
+        self.uint4 = ct.c_uint32()
+        self.int2 = ct.c_int16()
+        self.int4 = ct.c_int32()
+        self.boolean = ct.c_uint()
+
 
+_SYS_PROP_SET_SCRATCH = _SysPropSetScratch()
 
-_SYS_PROP_TYPE_SET_ARG: Dict[SysPropType, Callable] = {
-    SysPropType.STR:        lambda v: v.encode(),
-    SysPropType.REAL:       lambda v: ct.pointer(ct.c_float(v)),
-    SysPropType.UINT2:      lambda v: ct.pointer(ct.c_uint16(v)),
-    SysPropType.UINT4:      lambda v: ct.pointer(ct.c_uint32(v)),
-    SysPropType.INT2:       lambda v: ct.pointer(ct.c_int16(v)),
-    SysPropType.INT4:       lambda v: ct.pointer(ct.c_int32(v)),
-    SysPropType.BOOLEAN:    lambda v: ct.pointer(ct.c_uint(v)),
-}
+
+def _sys_prop_set_scalar(attr_name: str) -> Callable:
+    def set_arg(value):
+        scalar = getattr(_SYS_PROP_SET_SCRATCH, attr_name)
+        scalar.value = value
+        return ct.byref(scalar)
+    return set_arg
+
+
+class _DeviceScratch(threading.local):
+    """
+    Reusable per-thread output buffers for Device methods.
+
+    ctypes object construction is a significant share of the wrapper
+    overhead, and these buffers are always consumed before the next
+    call on the same thread, so reuse is safe. Distinct fields are
+    provided where a single call needs two buffers of the same type.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ushort_a = ct.c_ushort()
+        self.ushort_b = ct.c_ushort()
+        self.ubyte_a = ct.c_ubyte()
+        self.ubyte_b = ct.c_ubyte()
+        self.sys_prop = ct.create_string_buffer(1024)  # Should be enough for all types
+
+
+_SCRATCH = _DeviceScratch()
+
+
+_SYS_PROP_TYPE_SET_ARG: Tuple[Callable, ...] = (
+    lambda v: v.encode(),               # SysPropType.STR
+    _sys_prop_set_scalar('real'),       # SysPropType.REAL
+    _sys_prop_set_scalar('uint2'),      # SysPropType.UINT2
+    _sys_prop_set_scalar('uint4'),      # SysPropType.UINT4
+    _sys_prop_set_scalar('int2'),       # SysPropType.INT2
+    _sys_prop_set_scalar('int4'),       # SysPropType.INT4
+    _sys_prop_set_scalar('boolean'),    # SysPropType.BOOLEAN
+)
 
 
 _STR_SIZE = 1024  # Undocumented but, hopefully, long enough
 
 
-_PARAM_TYPE_GET_ARG: Dict[ParamType, Callable[[int], ct.Array]] = {
+# array.array typecodes matching the ctypes element types of
+# _PARAM_TYPE_GET_ARG, for the as_array return path of the getters.
+_PARAM_TYPE_ARRAY_TYPECODE: Tuple[Optional[str], ...] = (
+    'f',   # ParamType.NUMERIC
+    'i',   # ParamType.ONOFF
+    'i',   # ParamType.CHSTATUS
+    'i',   # ParamType.BDSTATUS
+    'i',   # ParamType.BINARY
+    None,  # ParamType.STRING
+    'i',   # ParamType.ENUM
+)
+
+
+_PARAM_TYPE_GET_ARG: Tuple[Callable[[int], ct.Array], ...] = (
     # c_int is replaced by c_uint on some systems, but should be the same.
-    ParamType.NUMERIC:      lambda n: (ct.c_float * n)(),
-    ParamType.ONOFF:        lambda n: (ct.c_int * n)(),
-    ParamType.CHSTATUS:     lambda n: (ct.c_int * n)(),
-    ParamType.BDSTATUS:     lambda n: (ct.c_int * n)(),
-    ParamType.BINARY:       lambda n: (ct.c_int * n)(),
-    ParamType.STRING:       lambda n: (ct.c_char * (_STR_SIZE * n))(),
-    ParamType.ENUM:         lambda n: (ct.c_int * n)(),
+    lambda n: (ct.c_float * n)(),               # ParamType.NUMERIC
+    lambda n: (ct.c_int * n)(),                 # ParamType.ONOFF
+    lambda n: (ct.c_int * n)(),                 # ParamType.CHSTATUS
+    lambda n: (ct.c_int * n)(),                 # ParamType.BDSTATUS
+    lambda n: (ct.c_int * n)(),                 # ParamType.BINARY
+    lambda n: (ct.c_char * (_STR_SIZE * n))(),  # ParamType.STRING
+    lambda n: (ct.c_int * n)(),                 # ParamType.ENUM
     # ParamType.CMD is never found on readable parameters
-}
+)
 
 
-_PARAM_TYPE_SET_ARG: Dict[ParamType, Callable[[Any, int], Any]] = {
+_PARAM_TYPE_SET_ARG: Tuple[Callable[[Any, int], Any], ...] = (
     # We generate an array with the same value for the reason described
     # in the caller docstring.
     # c_int is replaced by c_uint on some systems, but should be the same.
-    ParamType.NUMERIC:      lambda v, n: (ct.c_float * n)(*[v]*n),
-    ParamType.ONOFF:        lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.CHSTATUS:     lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.BDSTATUS:     lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.BINARY:       lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.STRING:       lambda v, n: v.encode(),  # no array here, only first value is used
-    ParamType.ENUM:         lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.CMD:          lambda v, n: ct.c_void_p(),  # value ignored, return a null pointer
-}
-
-
-_SYS_PROP_TYPE_EVENT_ARG: Dict[SysPropType, Callable[[_IdValueRaw], Union[str, float, int]]] = {
-    SysPropType.STR:        lambda v: v.StringValue.decode(),
-    SysPropType.REAL:       lambda v: v.FloatValue,
-    SysPropType.UINT2:      lambda v: v.IntValue,
-    SysPropType.UINT4:      lambda v: v.IntValue,
-    SysPropType.INT2:       lambda v: v.IntValue,
-    SysPropType.INT4:       lambda v: v.IntValue,
-    SysPropType.BOOLEAN:    lambda v: v.IntValue,
-}
-
-
-_PARAM_TYPE_EVENT_ARG: Dict[ParamType, Callable] = {
-    ParamType.NUMERIC:      lambda v: v.FloatValue,
-    ParamType.ONOFF:        lambda v: v.IntValue,
-    ParamType.CHSTATUS:     lambda v: v.IntValue,
-    ParamType.BDSTATUS:     lambda v: v.IntValue,
-    ParamType.BINARY:       lambda v: v.IntValue,
-    ParamType.STRING:       lambda v: v.StringValue.decode(),
-    ParamType.ENUM:         lambda v: v.IntValue,
-    ParamType.CMD:          lambda v: v.IntValue,
-}
+    lambda v, n: (ct.c_float * n)(*[v]*n),  # ParamType.NUMERIC
+    lambda v, n: (ct.c_int * n)(*[v]*n),    # ParamType.ONOFF
+    lambda v, n: (ct.c_int * n)(*[v]*n),    # ParamType.CHSTATUS
+    lambda v, n: (ct.c_int * n)(*[v]*n),    # ParamType.BDSTATUS
+    lambda v, n: (ct.c_int * n)(*[v]*n),    # ParamType.BINARY
+    lambda v, n: v.encode(),                # ParamType.STRING: no array here, only first value is used
+    lambda v, n: (ct.c_int * n)(*[v]*n),    # ParamType.ENUM
+    lambda v, n: ct.c_void_p(),             # ParamType.CMD: value ignored, return a null pointer
+)
+
+
+_SYS_PROP_TYPE_EVENT_ARG: Tuple[Callable[[_IdValueRaw], Union[str, float, int]], ...] = (
+    lambda v: v.StringValue.decode(),   # SysPropType.STR
+    lambda v: v.FloatValue,             # SysPropType.REAL
+    lambda v: v.IntValue,               # SysPropType.UINT2
+    lambda v: v.IntValue,               # SysPropType.UINT4
+    lambda v: v.IntValue,               # SysPropType.INT2
+    lambda v: v.IntValue,               # SysPropType.INT4
+    lambda v: v.IntValue,               # SysPropType.BOOLEAN
+)
+
+
+_PARAM_TYPE_EVENT_ARG: Tuple[Callable, ...] = (
+    lambda v: v.FloatValue,             # ParamType.NUMERIC
+    lambda v: v.IntValue,               # ParamType.ONOFF
+    lambda v: v.IntValue,               # ParamType.CHSTATUS
+    lambda v: v.IntValue,               # ParamType.BDSTATUS
+    lambda v: v.IntValue,               # ParamType.BINARY
+    lambda v: v.StringValue.decode(),   # ParamType.STRING
+    lambda v: v.IntValue,               # ParamType.ENUM
+    lambda v: v.IntValue,               # ParamType.CMD
+)
+
+
+class _AutoPtr:
+    """
+    Context manager to auto free on scope exit.
+
+    The pointer is initialized to NULL to avoid error when freeing, in
+    case callee function does not set the pointer. A plain class is
+    used instead of @contextmanager because these scopes are entered on
+    every call of several bindings, and the generator trampoline would
+    be pure overhead there.
+    """
+
+    __slots__ = ('__value', '__free')
+
+    def __init__(self, pointer_type: Type, free: Callable) -> None:
+        self.__value = _P(pointer_type)()
+        if __debug__:
+            assert bool(self.__value) is False  # Must be NULL
+        self.__free = free
+
+    def __enter__(self):
+        return self.__value
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.__free(self.__value)
 
 
 class _Lib(_utils.Lib):
@@ -480,27 +641,20 @@ class _Lib(_utils.Lib):
         return res
 
     def __get(self, name: str, *args: Type, **kwargs) -> Callable[..., int]:
-        # Use lib_variadic as API is __cdecl
-        func = getattr(self.lib_variadic, f'CAENHV_{name}')
-        func.argtypes = args
-        func.restype = ct.c_int
         if kwargs.get('handle_errcheck', True):
-            func.errcheck = self.__api_handle_errcheck
+            errcheck = self.__api_handle_errcheck
         else:
-            func.errcheck = self.__api_errcheck
-        return func
+            errcheck = self.__api_errcheck
+        # Use variadic as API is __cdecl
+        return self.get_function(f'CAENHV_{name}', ct.c_int, args, variadic=True, errcheck=errcheck)
 
     def __get_str(self, name: str, *args: Type, **kwargs) -> Callable[..., str]:
-        # Use lib_variadic as API is __cdecl
         if kwargs.get('legacy', False):
             func_name = f'CAENHV{name}'
         else:
             func_name = f'CAENHV_{name}'
-        func = getattr(self.lib_variadic, func_name)
-        func.argtypes = args
-        func.restype = ct.c_char_p
-        func.errcheck = lambda res, func, args: res.decode()
-        return func
+        # Use variadic as API is __cdecl
+        return self.get_function(func_name, ct.c_char_p, args, variadic=True, errcheck=lambda res, func, args: res.decode())
 
     def __ver_at_least(self, target: Tuple[int, ...]) -> bool:
         ver = self.sw_release()
@@ -526,37 +680,17 @@ class _Lib(_utils.Lib):
         """
         return self.__ver_at_least((7, 0, 0))
 
-    @contextmanager
-    def auto_ptr(self, pointer_type: Type):
+    def auto_ptr(self, pointer_type: Type) -> _AutoPtr:
         """
         Context manager to auto free on scope exit.
-
-        The returned pointer is initialized to NULL to avoid error
-        when freeing, in case callee function does not set the pointer.
         """
-        value = _P(pointer_type)()
-        if __debug__:
-            assert bool(value) is False  # Must be NULL
-        try:
-            yield value
-        finally:
-            self.__free(value)
+        return _AutoPtr(pointer_type, self.__free)
 
-    @contextmanager
-    def evt_data_auto_ptr(self):
+    def evt_data_auto_ptr(self) -> _AutoPtr:
         """
-        Context manager to auto free event data on scope exit
-
-        The returned pointer is initialized to NULL to avoid error
-        when freeing, in case callee function does not set the pointer.
+        Context manager to auto free event data on scope exit.
         """
-        value = _P(_EventDataRaw)()
-        if __debug__:
-            assert bool(value) is False  # Must be NULL
-        try:
-            yield value
-        finally:
-            self.__free_event_data(value)
+        return _AutoPtr(_EventDataRaw, self.__free_event_data)
 
 
 # Library name is platform dependent
@@ -569,6 +703,35 @@ else:
 lib = _Lib(_LIB_NAME)
 
 
+class PreparedChParam:
+    """
+    Pre-marshalled channel parameter query.
+
+    Captures the Python side setup of a get_ch_param call (encoded
+    name, channel index array, output buffer and parameter type) once,
+    so that read() only performs the foreign call and the result
+    conversion. To be used inside polling loops, where the setup would
+    otherwise dominate the call cost.
+
+    The handle is read from the device on every call, so closing and
+    reconnecting the device does not invalidate the prepared query.
+    Instances are built with Device.prepare_ch_param().
+    """
+
+    def __init__(self, device: 'Device', slot: int, channel_list: Sequence[int], name: str, param_type: ParamType) -> None:
+        self.__device = device
+        self.__slot = slot
+        self.__name = _enc(name)
+        self.__n_indexes = len(channel_list)
+        self.__index_list = _utils.to_ctypes_array(channel_list, ct.c_ushort)
+        self.__data = _PARAM_TYPE_GET_ARG[param_type](self.__n_indexes)
+
+    def read(self) -> Union[List[float], List[int]]:
+        """Same of Device.get_ch_param(), without the per-call setup."""
+        lib.get_ch_param(self.__device.handle, self.__slot, self.__name, self.__n_indexes, self.__index_list, self.__data)
+        return self.__data[:]
+
+
 @dataclass
 class Device:
     """
@@ -599,6 +762,18 @@ class Device:
         self.__port = 0
         self.__skt_server = None
         self.__skt_client = None
+        self.__skt_client_fd = None  # Cached fileno of __skt_client
+        # Reused get_event_data output arguments: the library overwrites
+        # both on every call, and the event socket has a single reader,
+        # so per-call allocations would be pure churn.
+        self.__evt_status = _SystemStatusRaw()
+        self.__evt_data_number = ct.c_uint()
+        # Reused param output buffers, see __get_out_buf
+        self.__out_buf_local = threading.local()
+        # Reused subscribe result-code buffers, see __rc_buf
+        self.__rc_buf_local = threading.local()
+        # Event value converters, see __decode_event_value
+        self.__evt_conv_cache = {}
 
     def __del__(self) -> None:
         if self.__opened:
@@ -638,6 +813,7 @@ class Device:
         This will also clear class cache.
         """
         lib.deinit_system(self.handle)
+        self.__evt_conv_cache.clear()
         self.__opened = False
 
     @_utils.lru_cache_clear(cache_manager=__node_cache_manager)
@@ -648,6 +824,7 @@ class Device:
         This will also clear class cache, since the function
         invalidates some internal stuctures of the C library.
         """
+        self.__evt_conv_cache.clear()
         l_nos = ct.c_ushort()
         g_nocl = lib.auto_ptr(ct.c_ushort)
         g_ml = lib.auto_ptr(ct.c_char)
@@ -694,8 +871,8 @@ class Device:
         """
         Binding of CAENHV_GetSysProp()
         """
-        l_value = ct.create_string_buffer(1024)  # Should be enough for all types
-        lib.get_sys_prop(self.handle, name.encode(), l_value)
+        l_value = _SCRATCH.sys_prop
+        lib.get_sys_prop(self.handle, _enc(name), l_value)
         prop_type = self.get_sys_prop_info(name).type
         return _SYS_PROP_TYPE_GET_ARG[prop_type](l_value)
 
@@ -705,18 +882,22 @@ class Device:
         """
         prop_type = self.get_sys_prop_info(name).type
         l_value = _SYS_PROP_TYPE_SET_ARG[prop_type](value)
-        lib.set_sys_prop(self.handle, name.encode(), l_value)
+        lib.set_sys_prop(self.handle, _enc(name), l_value)
 
-    def get_bd_param(self, slot_list: Sequence[int], name: str) -> Union[List[str], List[float], List[int]]:
+    def get_bd_param(self, slot_list: Sequence[int], name: str, as_array: bool = False) -> Union[List[str], List[float], List[int], array]:
         """
         Binding of CAENHV_GetBdParam()
+
+        With @p as_array set, numeric results are returned as an
+        array.array filled with a single C-level copy, with no
+        per-element boxing; not supported on STRING parameters.
         """
         n_indexes = len(slot_list)
         if n_indexes == 0:
             return []  # type: ignore
         first_index = slot_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(first_index, name)
-        l_data = _PARAM_TYPE_GET_ARG[param_type](n_indexes)
+        l_data = self.__get_out_buf(param_type, n_indexes)
         if param_type is ParamType.STRING and self.__char_p_p_str_bd_param_arg():
             # Some systems require a char** instead of a char*: we build it using the same buffer, with different decode.
             p_begin = ct.addressof(l_data)
@@ -726,13 +907,19 @@ class Device:
             l_data_proxy = (ct.c_void_p * n_indexes)(*range(p_begin, p_begin + p_size, _STR_SIZE))
         else:
             l_data_proxy = l_data
-        l_index_list = (ct.c_ushort * n_indexes)(*slot_list)
-        lib.get_bd_param(self.handle, n_indexes, l_index_list, name.encode(), l_data_proxy)
+        l_index_list = _utils.to_ctypes_array(slot_list, ct.c_ushort)
+        lib.get_bd_param(self.handle, n_indexes, l_index_list, _enc(name), l_data_proxy)
         if param_type is ParamType.STRING:
+            if as_array:
+                raise ValueError('as_array not supported on STRING parameters')
             if self.__char_p_p_str_bd_param_arg():
                 return list(_utils.str_from_n_char_array(l_data, _STR_SIZE, n_indexes))
             else:
                 return list(_utils.str_from_char(l_data, n_indexes))
+        elif as_array:
+            values = array(_PARAM_TYPE_ARRAY_TYPECODE[param_type])
+            values.frombytes(memoryview(l_data).cast('B'))
+            return values
         else:
             return l_data[:]
 
@@ -755,8 +942,8 @@ class Device:
         first_index = slot_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(first_index, name)
         l_data = _PARAM_TYPE_SET_ARG[param_type](value, n_indexes)
-        l_index_list = (ct.c_ushort * n_indexes)(*slot_list)
-        lib.set_bd_param(self.handle, n_indexes, l_index_list, name.encode(), l_data)
+        l_index_list = _utils.to_ctypes_array(slot_list, ct.c_ushort)
+        lib.set_bd_param(self.handle, n_indexes, l_index_list, _enc(name), l_data)
 
     def get_bd_param_prop(self, slot: int, name: str) -> ParamProp:
         """
@@ -778,12 +965,13 @@ class Device:
         """
         Binding of CAENHV_TestBdPresence()
         """
-        l_nr_of_ch = ct.c_ushort()
+        scratch = _SCRATCH
+        l_nr_of_ch = scratch.ushort_a
         g_model = lib.auto_ptr(ct.c_char)
         g_description = lib.auto_ptr(ct.c_char)
-        l_ser_num = ct.c_ushort()
-        l_fmw_rel_min = ct.c_ubyte()
-        l_fmw_rel_max = ct.c_ubyte()
+        l_ser_num = scratch.ushort_b
+        l_fmw_rel_min = scratch.ubyte_a
+        l_fmw_rel_max = scratch.ubyte_b
         with g_model as l_m, g_description as l_d:
             lib.test_bd_presence(self.handle, slot, l_nr_of_ch, l_m, l_d, l_ser_num, l_fmw_rel_min, l_fmw_rel_max)
             model = l_m.contents.value.decode()
@@ -820,7 +1008,7 @@ class Device:
         n_indexes = len(channel_list)
         if n_indexes == 0:
             return []  # type: ignore
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
+        l_index_list = _utils.to_ctypes_array(channel_list, ct.c_ushort)
         n_allocated_values = n_indexes + 1  # In case library tries to set an empty string after the last
         l_value = (ct.c_char * (self.MAX_CH_NAME * n_allocated_values))()
         lib.get_ch_name(self.handle, slot, n_indexes, l_index_list, l_value)
@@ -833,19 +1021,21 @@ class Device:
         n_indexes = len(channel_list)
         if n_indexes == 0:
             return
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
+        l_index_list = _utils.to_ctypes_array(channel_list, ct.c_ushort)
         lib.set_ch_name(self.handle, slot, n_indexes, l_index_list, name.encode())
 
-    def get_ch_param(self, slot: int, channel_list: Sequence[int], name: str) -> Union[List[str], List[float], List[int]]:
+    def get_ch_param(self, slot: int, channel_list: Sequence[int], name: str, as_array: bool = False) -> Union[List[str], List[float], List[int], array]:
         """
         Binding of CAENHV_GetChParam()
+
+        See comment on get_bd_param() about @p as_array.
         """
         n_indexes = len(channel_list)
         if n_indexes == 0:
             return []  # type: ignore
         first_index = channel_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(slot, name, first_index)
-        l_data = _PARAM_TYPE_GET_ARG[param_type](n_indexes)
+        l_data = self.__get_out_buf(param_type, n_indexes)
         if param_type is ParamType.STRING and self.__char_p_p_str_ch_param_arg():
             # Some systems require a char** instead of a char*: we build it using the same buffer, with different decode.
             p_begin = ct.addressof(l_data)
@@ -854,16 +1044,75 @@ class Device:
             l_data_proxy = (ct.c_void_p * n_indexes)(*range(p_begin, p_begin + p_size, _STR_SIZE))
         else:
             l_data_proxy = l_data
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
-        lib.get_ch_param(self.handle, slot, name.encode(), n_indexes, l_index_list, l_data_proxy)
+        l_index_list = _utils.to_ctypes_array(channel_list, ct.c_ushort)
+        lib.get_ch_param(self.handle, slot, _enc(name), n_indexes, l_index_list, l_data_proxy)
         if param_type is ParamType.STRING:
+            if as_array:
+                raise ValueError('as_array not supported on STRING parameters')
             if self.__char_p_p_str_ch_param_arg():
                 return list(_utils.str_from_n_char_array(l_data, _STR_SIZE, n_indexes))
             else:
                 return list(_utils.str_from_char(l_data, n_indexes))
+        elif as_array:
+            values = array(_PARAM_TYPE_ARRAY_TYPECODE[param_type])
+            values.frombytes(memoryview(l_data).cast('B'))
+            return values
         else:
             return l_data[:]
 
+    def __get_out_buf(self, param_type: ParamType, n_indexes: int) -> ct.Array:
+        """
+        Reused output buffer for the param getters.
+
+        Keyed by parameter type and element count, with one cache per
+        thread since get_ch_param_batch runs reads on the same device
+        concurrently. No zeroing between calls: the library overwrites
+        every element (or terminator, for strings) it reports, and the
+        values are copied out before the next call on the same thread.
+        """
+        local = self.__out_buf_local
+        try:
+            cache = local.cache
+        except AttributeError:
+            cache = local.cache = {}
+        key = (param_type, n_indexes)
+        buf = cache.get(key)
+        if buf is None:
+            buf = cache[key] = _PARAM_TYPE_GET_ARG[param_type](n_indexes)
+        return buf
+
+    def get_ch_param_batch(self, requests: Sequence[Tuple[int, Sequence[int], str]]) -> List[Union[List[str], List[float], List[int]]]:
+        """
+        Execute several get_ch_param() calls concurrently.
+
+        Since ctypes releases the GIL for the duration of each library
+        call, requests to different slots overlap their crate round
+        trips instead of paying one network latency each; the CAEN HV
+        Wrapper is thread safe on a single handle. Each request is a
+        (slot, channel_list, name) tuple, and results are returned in
+        request order.
+        """
+        if len(requests) == 0:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(requests), 16)) as executor:
+            return list(executor.map(lambda req: self.get_ch_param(*req), requests))
+
+    def prepare_ch_param(self, slot: int, channel_list: Sequence[int], name: str) -> PreparedChParam:
+        """
+        Build a PreparedChParam for repeated reads of the same channel
+        parameter: the argument marshalling is done once here and
+        PreparedChParam.read() only performs the library call.
+
+        STRING parameters are not supported, since their output buffer
+        layout depends on the system type.
+        """
+        if len(channel_list) == 0:
+            raise ValueError('channel_list must not be empty')
+        param_type = self.__get_param_type(slot, name, channel_list[0])
+        if param_type is ParamType.STRING:
+            raise ValueError('STRING parameters are not supported by prepared queries')
+        return PreparedChParam(self, slot, channel_list, name, param_type)
+
     def set_ch_param(self, slot: int, channel_list: Sequence[int], name: str, value: Optional[Union[str, float, int]]) -> None:
         """
         Binding of CAENHV_SetChParam()
@@ -876,8 +1125,8 @@ class Device:
         first_index = channel_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(slot, name, first_index)
         l_data = _PARAM_TYPE_SET_ARG[param_type](value, n_indexes)
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
-        lib.set_ch_param(self.handle, slot, name.encode(), n_indexes, l_index_list, ct.byref(l_data))
+        l_index_list = _utils.to_ctypes_array(channel_list, ct.c_ushort)
+        lib.set_ch_param(self.handle, slot, _enc(name), n_indexes, l_index_list, ct.byref(l_data))
 
     @_utils.lru_cache_method(cache_manager=__node_cache_manager)
     def get_exec_comm_list(self) -> Tuple[str, ...]:
@@ -894,106 +1143,88 @@ class Device:
         """
         Binding of CAENHV_ExecComm()
         """
-        lib.exec_comm(self.handle, name.encode())
+        lib.exec_comm(self.handle, _enc(name))
 
-    def subscribe_system_params(self, param_list: Sequence[str]) -> None:
+    def __rc_buf(self, n: int) -> ct.Array:
         """
-        Binding of CAENHV_SubscribeSystemParams()
+        Reused result-code buffer for the (un)subscribe methods, keyed
+        by length, with one cache per thread (like __get_out_buf) so
+        concurrent (un)subscribes do not share a buffer. Zeroed before
+        reuse, since the library may leave the codes of successful
+        parameters untouched.
+        """
+        local = self.__rc_buf_local
+        try:
+            cache = local.cache
+        except AttributeError:
+            cache = local.cache = {}
+        buf = cache.get(n)
+        if buf is None:
+            buf = cache[n] = (ct.c_char * n)()
+        else:
+            ct.memset(buf, 0, n)
+        return buf
+
+    def __params_dispatch(self, func: Callable, index_args: Tuple, param_list: Sequence[str], func_name: str, init_events: bool = False) -> None:
+        """
+        Common implementation of the six (un)subscribe methods, that
+        differ only in the library function and its slot/channel
+        arguments. The handle and the port are injected here rather
+        than by the callers: the port is assigned by
+        __init_events_server() on the first subscribe of a device, so
+        it must be read after that call.
         """
         param_list_len = len(param_list)
         if param_list_len == 0:
             return
-        self.__init_events_server()
-        l_param_name_list = ':'.join(param_list).encode()
-        l_result_codes = (ct.c_char * param_list_len)()
-        lib.subscribe_system_params(self.handle, self.__port, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
+        if init_events:
+            self.__init_events_server()
+        l_param_name_list = _encode_params(tuple(param_list))
+        l_result_codes = self.__rc_buf(param_list_len)
+        func(self.handle, self.__port, *index_args, l_param_name_list, param_list_len, l_result_codes)
+        # memoryview scans the array in place, without the bytes copy,
+        # and any() walks it at C level on the all-succeeded fast path.
+        result_codes = memoryview(l_result_codes).cast('B')
         if any(result_codes):
             # resuls_codes values are not instances of ::CAENHVRESULT
             failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'subscribe_system_params failed at params {failed_params}')
+            raise RuntimeError(f'{func_name} failed at params {failed_params}')
+
+    def subscribe_system_params(self, param_list: Sequence[str]) -> None:
+        """
+        Binding of CAENHV_SubscribeSystemParams()
+        """
+        self.__params_dispatch(lib.subscribe_system_params, (), param_list, 'subscribe_system_params', init_events=True)
 
     def subscribe_board_params(self, slot: int, param_list: Sequence[str]) -> None:
         """
         Binding of CAENHV_SubscribeBoardParams()
         """
-        param_list_len = len(param_list)
-        if param_list_len == 0:
-            return
-        self.__init_events_server()
-        l_param_name_list = ':'.join(param_list).encode()
-        l_result_codes = (ct.c_char * param_list_len)()
-        lib.subscribe_board_params(self.handle, self.__port, slot, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
-            # resuls_codes values are not instances of ::CAENHVRESULT
-            failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'subscribe_board_params failed at params {failed_params}')
+        self.__params_dispatch(lib.subscribe_board_params, (slot,), param_list, 'subscribe_board_params', init_events=True)
 
     def subscribe_channel_params(self, slot: int, channel: int, param_list: Sequence[str]) -> None:
         """
         Binding of CAENHV_SubscribeChannelParams()
         """
-        param_list_len = len(param_list)
-        if param_list_len == 0:
-            return
-        self.__init_events_server()
-        l_param_name_list = ':'.join(param_list).encode()
-        l_result_codes = (ct.c_char * param_list_len)()
-        lib.subscribe_channel_params(self.handle, self.__port, slot, channel, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
-            # resuls_codes values are not instances of ::CAENHVRESULT
-            failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'subscribe_channel_params failed at params {failed_params}')
+        self.__params_dispatch(lib.subscribe_channel_params, (slot, channel), param_list, 'subscribe_channel_params', init_events=True)
 
     def unsubscribe_system_params(self, param_list: Sequence[str]) -> None:
         """
         Binding of CAENHV_UnSubscribeSystemParams()
         """
-        param_list_len = len(param_list)
-        if param_list_len == 0:
-            return
-        l_param_name_list = ':'.join(param_list).encode()
-        l_result_codes = (ct.c_char * param_list_len)()
-        lib.unsubscribe_system_params(self.handle, self.__port, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
-            # resuls_codes values are not instances of ::CAENHVRESULT
-            failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'unsubscribe_system_params failed at params {failed_params}')
+        self.__params_dispatch(lib.unsubscribe_system_params, (), param_list, 'unsubscribe_system_params')
 
     def unsubscribe_board_params(self, slot: int, param_list: Sequence[str]) -> None:
         """
         Binding of CAENHV_UnSubscribeBoardParams()
         """
-        param_list_len = len(param_list)
-        if param_list_len == 0:
-            return
-        l_param_name_list = ':'.join(param_list).encode()
-        l_result_codes = (ct.c_char * param_list_len)()
-        lib.unsubscribe_board_params(self.handle, self.__port, slot, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
-            # resuls_codes values are not instances of ::CAENHVRESULT
-            failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'unsubscribe_board_params failed at params {failed_params}')
+        self.__params_dispatch(lib.unsubscribe_board_params, (slot,), param_list, 'unsubscribe_board_params')
 
     def unsubscribe_channel_params(self, slot: int, channel: int, param_list: Sequence[str]) -> None:
         """
-        Binding of CAENHV_SubscribeChannelParams()
+        Binding of CAENHV_UnSubscribeChannelParams()
         """
-        param_list_len = len(param_list)
-        if param_list_len == 0:
-            return
-        l_param_name_list = ':'.join(param_list).encode()
-        l_result_codes = (ct.c_char * param_list_len)()
-        lib.unsubscribe_channel_params(self.handle, self.__port, slot, channel, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
-            # resuls_codes values are not instances of ::CAENHVRESULT
-            failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'unsubscribe_channel_params failed at params {failed_params}')
+        self.__params_dispatch(lib.unsubscribe_channel_params, (slot, channel), param_list, 'unsubscribe_channel_params')
 
     def get_event_data(self) -> Tuple[Tuple[EventData, ...], SystemStatus]:
         """
@@ -1004,18 +1235,73 @@ class Device:
         transparent to the user.
         """
         self.__init_events_client()
-        assert self.__skt_client is not None
-        l_system_status = _SystemStatusRaw()
+        assert self.__skt_client_fd is not None
+        l_system_status = self.__evt_status
         g_event_data = lib.evt_data_auto_ptr()
-        l_data_number = ct.c_uint()
+        l_data_number = self.__evt_data_number
         with g_event_data as l_ed:
-            lib.get_event_data(self.__skt_client.fileno(), l_system_status, l_ed, l_data_number)
+            lib.get_event_data(self.__skt_client_fd, l_system_status, l_ed, l_data_number)
             events = tuple(self.__decode_event_data(l_ed, l_data_number.value))
-        system_status = EventStatus(l_system_status.System)
-        board_status = tuple(EventStatus(i) for i in l_system_status.Board)
+        # Members with value 0 are falsy ints, so membership is tested
+        # explicitly rather than with dict.get() truthiness.
+        members = _EVENT_STATUS_MEMBERS
+        system = l_system_status.System
+        system_status = members[system] if system in members else EventStatus(system)
+        board_status = tuple(members[i] if i in members else EventStatus(i) for i in l_system_status.Board)
         status = SystemStatus(system_status, board_status)
         return events, status
 
+    def get_event_data_batch(self, max_events: int = 64) -> Tuple[Tuple[EventData, ...], SystemStatus]:
+        """
+        Same of get_event_data(), draining the data already pending on
+        the event socket.
+
+        The first library call blocks like get_event_data(); further
+        calls are issued only while the socket has buffered data and
+        less than @p max_events events have been collected, so a burst
+        of events is consumed in one method call instead of one per
+        library read. Returns the events of all the reads and the
+        status reported by the last one.
+        """
+        events, status = self.get_event_data()
+        assert self.__skt_client_fd is not None
+        fd = self.__skt_client_fd
+        all_events = list(events)
+        while len(all_events) < max_events:
+            readable, _, _ = select.select((fd,), (), (), 0.0)
+            if not readable:
+                break
+            events, status = self.get_event_data()
+            all_events.extend(events)
+        return tuple(all_events), status
+
+    async def get_event_data_async(self) -> Tuple[Tuple[EventData, ...], SystemStatus]:
+        """
+        Variant of get_event_data() for asyncio consumers.
+
+        Awaits readability of the event socket before issuing the
+        library read, so several devices can be multiplexed on a single
+        event loop without dedicating a blocking thread to each. Once
+        the socket is readable the read and decode run synchronously,
+        exactly as in get_event_data().
+        """
+        self.__init_events_client()
+        assert self.__skt_client_fd is not None
+        fd = self.__skt_client_fd
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+
+        def _on_readable() -> None:
+            if not fut.done():
+                fut.set_result(None)
+
+        loop.add_reader(fd, _on_readable)
+        try:
+            await fut
+        finally:
+            loop.remove_reader(fd)
+        return self.get_event_data()
+
     # Private utilities
 
     _R = TypeVar('_R', bound='ct._CData')
@@ -1032,9 +1318,9 @@ class Device:
         l_value = var_type(*args)
         try:
             if channel is None:
-                lib.get_bd_param_prop(self.handle, slot, name.encode(), prop_name, ct.byref(l_value))
+                lib.get_bd_param_prop(self.handle, slot, _enc(name), prop_name, ct.byref(l_value))
             else:
-                lib.get_ch_param_prop(self.handle, slot, channel, name.encode(), prop_name, ct.byref(l_value))
+                lib.get_ch_param_prop(self.handle, slot, channel, _enc(name), prop_name, ct.byref(l_value))
         except Error as ex:
             if ex.code is Error.Code.PARAMPROPNOTFOUND:
                 default = kwargs.get('default')
@@ -1043,10 +1329,25 @@ class Device:
             raise ex
         return l_value
 
+    @_utils.lru_cache_method(cache_manager=__node_cache_manager, maxsize=4096)
+    def __get_static_prop(self, slot: int, name: str, prop_name: bytes, channel: Optional[int], var_type: Callable[..., _R], *args, **kwargs) -> _R:
+        """
+        Same of __get_prop, memoized.
+
+        Only for properties that cannot change while connected (unit,
+        exponent, decimal, states, enum names): repeated property reads
+        of the same parameter skip their library round-trips, which
+        dominate the cost of get_bd_param_prop/get_ch_param_prop in
+        polling loops.
+        """
+        return self.__get_prop(slot, name, prop_name, channel, var_type, *args, **kwargs)
+
     def __get_param_prop(self, slot: int, name: str, channel: Optional[int] = None) -> ParamProp:
         """
         Get all parameter properties.
-        Cannot be cached since minval/maxval may depend on the value of other parameters.
+        Cannot be cached as a whole since minval/maxval may depend on
+        the value of other parameters; the static properties are
+        memoized individually by __get_static_prop.
         """
         # Mandatory values (raise if name is not valid)
         param_type = self.__get_param_type(slot, name, channel)
@@ -1055,23 +1356,23 @@ class Device:
         # Optional values
         if param_type is ParamType.NUMERIC:
             # Always defined
-            res.unit = ParamUnit(self.__get_prop(slot, name, b'Unit', channel, ct.c_ushort).value)
-            res.exp = self.__get_prop(slot, name, b'Exp', channel, ct.c_short).value
+            res.unit = ParamUnit(self.__get_static_prop(slot, name, b'Unit', channel, ct.c_ushort).value)
+            res.exp = self.__get_static_prop(slot, name, b'Exp', channel, ct.c_short).value
             # Not defined on some old systems
             res.minval = self.__get_prop(slot, name, b'Minval', channel, ct.c_float, default=0.).value
             res.maxval = self.__get_prop(slot, name, b'Maxval', channel, ct.c_float, default=0.).value
-            res.decimal = self.__get_prop(slot, name, b'Decimal', channel, ct.c_short, default=0).value
+            res.decimal = self.__get_static_prop(slot, name, b'Decimal', channel, ct.c_short, default=0).value
             if self.__resol_param_prop():
-                res.resol = self.__get_prop(slot, name, b'Resol', channel, ct.c_short, default=1).value
+                res.resol = self.__get_static_prop(slot, name, b'Resol', channel, ct.c_short, default=1).value
         elif param_type is ParamType.ONOFF:
-            res.onstate = self.__get_prop(slot, name, b'Onstate', channel, ct.c_char * _STR_SIZE).value.decode()
-            res.offstate = self.__get_prop(slot, name, b'Offstate', channel, ct.c_char * _STR_SIZE).value.decode()
+            res.onstate = self.__get_static_prop(slot, name, b'Onstate', channel, ct.c_char * _STR_SIZE).value.decode()
+            res.offstate = self.__get_static_prop(slot, name, b'Offstate', channel, ct.c_char * _STR_SIZE).value.decode()
         elif param_type is ParamType.ENUM:
             res.minval = self.__get_prop(slot, name, b'Minval', channel, ct.c_float).value
             res.maxval = self.__get_prop(slot, name, b'Maxval', channel, ct.c_float).value
             n_enums = int(res.maxval - res.minval + 1)
             assert n_enums <= self.MAX_ENUM_VALS
-            l_value = self.__get_prop(slot, name, b'Enum', channel, ct.c_char * (self.MAX_ENUM_NAME * self.MAX_ENUM_VALS))
+            l_value = self.__get_static_prop(slot, name, b'Enum', channel, ct.c_char * (self.MAX_ENUM_NAME * self.MAX_ENUM_VALS))
             res.enum = tuple(_utils.str_from_n_char_array(l_value, self.MAX_ENUM_NAME, n_enums))
         return res
 
@@ -1161,7 +1462,7 @@ class Device:
             self.__skt_server = skt
 
     def __init_events_client(self):
-        if self.__skt_client is not None:
+        if self.__skt_client_fd is not None:
             return
         self.__check_events_support()
         if self.__skt_server is None:
@@ -1191,6 +1492,9 @@ class Device:
                         break
                     arg.extend(char)
                 assert self.arg == arg.decode()
+        # Cached since get_event_data passes it to the library on every
+        # call, and fileno() is a method call into the socket layer.
+        self.__skt_client_fd = self.__skt_client.fileno()
 
     def __extended_get_param_type(self, slot: int, name: str, channel: Optional[int] = None) -> ParamType:
         """
@@ -1202,30 +1506,62 @@ class Device:
             return ParamType.STRING
         return self.__get_param_type(slot, name, channel)
 
-    def __decode_event_value(self, event_type: EventType, board_index: int, channel_index: int, item_id: str, value: _IdValueRaw) -> Union[str, float, int]:
-        if event_type is not EventType.PARAMETER:
+    # The default arguments bind module level names to locals, read
+    # with a LOAD_FAST instead of a global lookup on the per-event path.
+    def __decode_event_value(self, event_type: EventType, board_index: int, channel_index: int, item_id: str, value: _IdValueRaw, _sys_table: Tuple = _SYS_PROP_TYPE_EVENT_ARG, _param_table: Tuple = _PARAM_TYPE_EVENT_ARG, _parameter: EventType = EventType.PARAMETER) -> Union[str, float, int]:
+        if event_type is not _parameter:
             return -1
-        if board_index == -1:
-            prop_type = self.get_sys_prop_info(item_id).type
-            return _SYS_PROP_TYPE_EVENT_ARG[prop_type](value)
-        param_type = self.__extended_get_param_type(board_index, item_id, channel_index if channel_index != -1 else None)
-        return _PARAM_TYPE_EVENT_ARG[param_type](value)
+        # The resolved converter is kept in a plain dict keyed by the
+        # event source: after the first event of each kind the decode
+        # costs one dict probe, with no type lookup at all. The cache
+        # is cleared when the crate configuration may change, i.e. on
+        # close() and get_crate_map().
+        key = (board_index, channel_index, item_id)
+        conv = self.__evt_conv_cache.get(key)
+        if conv is None:
+            if board_index == -1:
+                prop_type = self.get_sys_prop_info(item_id).type
+                conv = _sys_table[prop_type]
+            else:
+                param_type = self.__extended_get_param_type(board_index, item_id, channel_index if channel_index != -1 else None)
+                conv = _param_table[param_type]
+            self.__evt_conv_cache[key] = conv
+        return conv(value)
 
     def __decode_event_data(self, event_data: ct._Pointer, n_events: int) -> Iterator[EventData]:
+        # Names used on every iteration are bound to locals: at high
+        # event rates the repeated global and attribute lookups are a
+        # measurable share of the decode loop.
+        handle = self.handle
+        decode_event_value = self.__decode_event_value
+        event_type_cls = EventType
+        event_type_members = _EVENT_TYPE_MEMBERS
+        event_data_cls = EventData
+        # The raw array lives only inside the evt_data_auto_ptr scope
+        # of the caller (the library frees it on exit), so events must
+        # be decoded eagerly; structure views built with from_address
+        # read the buffer in place, skipping the generic pointer
+        # indexing machinery for each event.
+        base_addr = ct.cast(event_data, ct.c_void_p).value
+        assert base_addr is not None
+        event_size = ct.sizeof(_EventDataRaw)
+        from_address = _EventDataRaw.from_address
         for i in range(n_events):
-            event: _EventDataRaw = event_data[i]
-            item_id = event.ItemID.decode()
-            if not item_id:
+            event = from_address(base_addr + i * event_size)
+            raw_item_id = event.ItemID
+            if not raw_item_id:
                 # There could be empty events, expecially from library event thread, to be ignored.
                 assert self.__library_event_thread()
                 continue
-            event_type = EventType(event.Type)
+            item_id = _dec(raw_item_id)
+            raw_type = event.Type
+            event_type = event_type_members[raw_type] if raw_type in event_type_members else event_type_cls(raw_type)
             system_handle = event.SystemHandle
-            assert system_handle == self.handle  # should always be the same
+            assert system_handle == handle  # should always be the same
             board_index = event.BoardIndex
             channel_index = event.ChannelIndex
-            value = self.__decode_event_value(event_type, board_index, channel_index, item_id, event.Value)
-            yield EventData(event_type, item_id, board_index, channel_index, value)
+            value = decode_event_value(event_type, board_index, channel_index, item_id, event.Value)
+            yield event_data_cls(event_type, item_id, board_index, channel_index, value)
 
     # Python utilities
 
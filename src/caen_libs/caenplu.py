@@ -209,11 +209,7 @@ class _Lib(_utils.Lib):
         return res
 
     def __get(self, name: str, *args: Type) -> Callable[..., int]:
-        func = getattr(self.lib, f'CAEN_PLU_{name}')
-        func.argtypes = args
-        func.restype = ct.c_int
-        func.errcheck = self.__api_errcheck
-        return func
+        return self.get_function(f'CAEN_PLU_{name}', ct.c_int, args, errcheck=self.__api_errcheck)
 
     # C API bindings
 
@@ -513,18 +513,10 @@ class _Lib(_utils.Lib):
             def fallback_win(*args, **kwargs):
                 raise RuntimeError(f'{name} function is Linux only.')
             return fallback_win
-        func = getattr(self.lib, f'CAENVME_{name}')
-        func.argtypes = args
-        func.restype = ct.c_int
-        func.errcheck = self.__api_errcheck
-        return func
+        return self.get_function(f'CAENVME_{name}', ct.c_int, args, errcheck=self.__api_errcheck)
 
     def __get_str(self, name: str, *args) -> Callable[..., str]:
-        func = getattr(self.lib, f'CAENVME_{name}')
-        func.argtypes = args
-        func.restype = ct.c_char_p
-        func.errcheck = lambda res, func, args: res.decode()
-        return func
+        return self.get_function(f'CAENVME_{name}', ct.c_char_p, args, errcheck=lambda res, func, args: res.decode())
 
     # C API bindings
 